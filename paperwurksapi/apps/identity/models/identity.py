@@ -64,6 +64,8 @@ class Identity(AbstractBaseUser, PermissionsMixin):
         indexes = [
             models.Index(fields=['email']),
             models.Index(fields=['entity', 'is_active']),
+            models.Index(fields=['is_active']),
+            models.Index(fields=['is_verified']),
             models.Index(fields=['verification_token']),
             models.Index(fields=['password_reset_token']),
         ]
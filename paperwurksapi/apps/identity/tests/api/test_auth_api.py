@@ -426,8 +426,9 @@ class TestTokenManagementAPI:
         """
         from paperwurksapi.apps.identity.utils import generate_token
         from datetime import datetime, timedelta
-        jwt_payload['exp'] = timezone.now() - timedelta(hours=1)
-        expired_token = generate_token(jwt_payload)
+        # Clone the module-scoped payload instead of mutating it
+        expired_payload = {**jwt_payload, 'exp': timezone.now() - timedelta(hours=1)}
+        expired_token = generate_token(expired_payload)
         api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {expired_token}')
         protected_url = '/api/identity/profile'
         response = api_client.get(protected_url)
@@ -446,7 +447,8 @@ class TestTokenManagementAPI:
         - Returns 401 for blacklisted token
         - Error message indicates token is invalid
         """
-        mock_redis.exists.return_value = True 
+        # Revoke via logout so the fake Redis blacklist holds the token.
+        authenticated_client.post('/api/identity/logout')
         protected_url = '/api/identity/profile'
         response = authenticated_client.get(protected_url)
         assert response.status_code == 401
@@ -8,6 +8,8 @@ Supports both sync and async testing for Django Ninja.
 import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 import bcrypt
 import json
@@ -37,18 +39,40 @@ def weak_password():
 
 @pytest.fixture
 def hashed_password(valid_password):
-    """Provide a bcrypt hashed password."""
-    salt = bcrypt.gensalt(rounds=12)
+    """Provide a bcrypt hashed password.
+
+    Cost 4 is the bcrypt minimum: the $2 prefix and checkpw behaviour
+    are identical to production cost, without the 2^12 key schedule.
+    """
+    salt = bcrypt.gensalt(rounds=4)
     return bcrypt.hashpw(valid_password.encode('utf-8'), salt).decode('utf-8')
 
 
+# Built once at import; MappingProxyType makes accidental mutation raise,
+# so tests merge overrides ({**identity_data, ...}) instead of copying.
+_IDENTITY_DATA = MappingProxyType({
+    'email': 'test.user@example.com',
+    'password': 'SecureP@ss123',
+})
+
+
 @pytest.fixture
-def identity_data(valid_email, valid_password):
-    """Provide valid identity creation data."""
-    return {
-        'email': valid_email,
-        'password': valid_password,
-    }
+def identity_data():
+    """Provide valid identity creation data (frozen, shared)."""
+    return _IDENTITY_DATA
+
+
+@pytest.fixture
+def identity_kwargs(identity_data):
+    """
+    Return a callable that merges overrides into identity_data.
+
+    Centralizes the `data = identity_data.copy(); data['email'] = ...`
+    pattern as a single dict merge per call.
+    """
+    def _make(**overrides):
+        return {**identity_data, **overrides}
+    return _make
 
 
 @pytest.fixture
@@ -74,11 +98,26 @@ def entity_data():
 
 
 @pytest.fixture
-def jwt_payload(identity_data):
-    """Provide a valid JWT token payload structure."""
+def login_body(mock_verified_identity, valid_password):
+    """Pre-encoded JSON login payload for mock_verified_identity."""
+    return json.dumps({
+        'email': mock_verified_identity.email,
+        'password': valid_password,
+    }).encode()
+
+
+@pytest.fixture(scope="module")
+def jwt_payload():
+    """
+    Provide a valid JWT token payload structure.
+
+    Module-scoped: tests needing altered claims (an expired ``exp``, a
+    different subject) clone with ``{**jwt_payload, ...}`` instead of
+    mutating the shared dict.
+    """
     return {
         'sub': str(uuid4()),
-        'email': identity_data['email'],
+        'email': _IDENTITY_DATA['email'],
         'entity_id': str(uuid4()),
         'iat': datetime.utcnow(),
         'exp': datetime.utcnow() + timedelta(hours=1),
@@ -86,6 +125,20 @@ def jwt_payload(identity_data):
     }
 
 
+@pytest.fixture(scope="module")
+def signed_jwt(jwt_payload):
+    """
+    One signed token per module, so the HMAC signing cost is amortized
+    across every test that only needs *a* valid token.
+
+    The import stays deferred: generate_token belongs to the
+    TDD-pending jwt_utils token API.
+    """
+    from apps.identity.utils.jwt_utils import generate_token
+
+    return generate_token(jwt_payload)
+
+
 @pytest.fixture
 def mock_entity(db, entity_data):
     """Create and return a test Entity instance."""
@@ -97,10 +150,15 @@ def mock_entity(db, entity_data):
 def mock_identity(db, identity_data, mock_entity):
     """Create and return a test Identity instance."""
     from apps.identity.models import Identity
-    return Identity.objects.create(
+    identity = Identity(
         entity=mock_entity,
-        **identity_data
+        email=identity_data['email'],
     )
+    # Hash through set_password so the cheap test hasher configured in
+    # settings/test.py applies, instead of storing the raw value.
+    identity.set_password(identity_data['password'])
+    identity.save()
+    return identity
 
 
 @pytest.fixture
@@ -112,6 +170,63 @@ def mock_verified_identity(db, mock_identity):
     return mock_identity
 
 
+@pytest.fixture(scope="module")
+def shared_entity(django_db_setup, django_db_blocker):
+    """
+    Module-scoped Entity for tests that only read from it.
+
+    Created once per module outside the per-test transaction, so tests
+    that never mutate the entity skip the per-test INSERT/ROLLBACK.
+    """
+    from apps.identity.tests.factories import EntityFactory
+
+    with django_db_blocker.unblock():
+        entity = EntityFactory()
+    yield entity
+    # Rows are committed outside the per-test transaction, so clean them
+    # up explicitly to keep count-based tests in other modules stable.
+    with django_db_blocker.unblock():
+        entity.delete()
+
+
+@pytest.fixture(scope="module")
+def shared_verified_identity(django_db_setup, django_db_blocker):
+    """
+    Module-scoped verified Identity for read-only tests.
+
+    Tests that mutate the identity (password reset, verification) should
+    keep using the function-scoped mock_verified_identity.
+    """
+    from apps.identity.tests.factories import IdentityFactory
+
+    with django_db_blocker.unblock():
+        identity = IdentityFactory(verified=True)
+    yield identity
+    with django_db_blocker.unblock():
+        entity = identity.entity
+        identity.delete()
+        entity.delete()
+
+
+@pytest.fixture(scope="class")
+def created_identity(django_db_setup, django_db_blocker):
+    """
+    Class-scoped Identity created once for read-only assertions.
+
+    Tests that check creation defaults share a single INSERT instead of
+    re-paying hashing and row creation per test.
+    """
+    from apps.identity.tests.factories import IdentityFactory
+
+    with django_db_blocker.unblock():
+        identity = IdentityFactory()
+    yield identity
+    with django_db_blocker.unblock():
+        entity = identity.entity
+        identity.delete()
+        entity.delete()
+
+
 @pytest.fixture
 def mock_unverified_identity(db, mock_identity):
     """Create and return an unverified Identity instance."""
@@ -129,69 +244,212 @@ def mock_inactive_identity(db, mock_identity):
     return mock_identity
 
 
-@pytest.fixture
-def multiple_entities(db):
-    """Create multiple entities for multi-tenancy testing."""
+@pytest.fixture(scope="module")
+def multiple_entities(django_db_setup, django_db_blocker):
+    """
+    Preload a pair of entities for multi-tenancy testing.
+
+    Committed once per module instead of re-INSERTed per test; each
+    test's own writes still roll back normally. The rows are removed on
+    teardown so they never leak into other modules' count-based
+    assertions.
+    """
     from apps.identity.models import Entity
-    
-    entity1 = Entity.objects.create(
-        name=f"Agency One {uuid4().hex[:8]}",
-        entity_type='estate_agency'
-    )
-    entity2 = Entity.objects.create(
-        name=f"Law Firm One {uuid4().hex[:8]}",
-        entity_type='law_firm'
-    )
-    
-    return {'entity1': entity1, 'entity2': entity2}
+
+    with django_db_blocker.unblock():
+        entity1, entity2 = Entity.objects.bulk_create([
+            Entity(name=f"Agency One {uuid4().hex[:8]}", entity_type='estate_agency'),
+            Entity(name=f"Law Firm One {uuid4().hex[:8]}", entity_type='law_firm'),
+        ])
+
+    yield {'entity1': entity1, 'entity2': entity2}
+
+    with django_db_blocker.unblock():
+        Entity.objects.filter(id__in=[entity1.id, entity2.id]).delete()
 
 
 @pytest.fixture
-def sample_identities(db, mock_entity, identity_data):
+def sample_identities(db, mock_entity, identity_kwargs):
     """Create multiple sample identities for bulk testing."""
     from apps.identity.models import Identity
-    
-    identities = []
-    for i in range(3):
-        data = identity_data.copy()
-        data['email'] = f"user{i}@example.com"
-        identity = Identity.objects.create(
-            entity=mock_entity,
-            **data
-        )
-        identities.append(identity)
-    
-    return identities
 
+    return Identity.objects.bulk_create([
+        Identity(entity=mock_entity, **identity_kwargs(email=f"user{i}@example.com"))
+        for i in range(3)
+    ])
 
-@pytest.fixture
-def mock_audit_service(mocker):
-    """Mock the AuditService for testing audit log creation."""
-    return mocker.patch('apps.identity.services.auth_service.AuditService')
 
+class _AuditSink:
+    """Minimal AuditService stand-in that records log kwargs in a list."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        # Service code may do AuditService().log(...); share the sink.
+        return self
+
+    async def log(self, *args, **kwargs):
+        self.calls.append(kwargs)
 
-@pytest.fixture
-def mock_email_service(mocker):
-    """Mock the email service for testing email sending."""
-    return mocker.patch('apps.identity.services.auth_service.send_email')
+
+class _NoopAudit:
+    """Audit stand-in that discards everything, for non-audit tests."""
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    async def log(self, *args, **kwargs):
+        pass
 
 
 @pytest.fixture
-def mock_redis(mocker):
-    """Mock Redis for testing token blacklist functionality."""
-    return mocker.patch('apps.identity.utils.jwt_utils.redis_client')
+def noop_audit_service(monkeypatch):
+    """
+    Swallow audit calls without recording anything.
+
+    For tests that never look at audit output at all: no list append, no
+    mock bookkeeping — just a plain coroutine that returns immediately.
+    Tests that count events want audit_log_sink; tests that inspect call
+    kwargs want mock_audit_service.
+    """
+    noop = _NoopAudit()
+    monkeypatch.setattr('apps.identity.services.auth_service.AuditService', noop)
+    return noop
 
 
 @pytest.fixture
+def audit_log_sink(monkeypatch):
+    """
+    Record audit calls in a plain list instead of a MagicMock.
+
+    Cheaper than MagicMock's _Call bookkeeping for tests that only count
+    events; tests that inspect call kwargs should keep mock_audit_service.
+    """
+    sink = _AuditSink()
+    monkeypatch.setattr('apps.identity.services.auth_service.AuditService', sink)
+    return sink
+
+
+@pytest.fixture(scope="session")
+def _shared_mock_registry():
+    """
+    Session registry of the patched-in shared doubles.
+
+    Once created, the session-scoped doubles stay patched in for the
+    rest of the run, so code paths they back can be exercised by tests
+    that never requested the fixture. Every instantiated double
+    registers here and reset_mocks clears them all unconditionally.
+    """
+    return []
+
+
+@pytest.fixture(scope="session")
+def mock_audit_service(_shared_mock_registry):
+    """
+    Mock the AuditService at its import location only.
+
+    Built once per session instead of per test, so the mock allocation
+    and patching happen once; reset_mocks clears call history between
+    tests. A plain MagicMock (no spec=) avoids re-introspecting the
+    service class. ``log`` is an AsyncMock shared between the class and
+    its instances, so both ``AuditService.log`` and
+    ``AuditService().log`` call styles land on the same record.
+    """
+    mock = MagicMock()
+    mock.log = AsyncMock()
+    mock.return_value = mock
+    mp = pytest.MonkeyPatch()
+    mp.setattr('apps.identity.services.auth_service.AuditService', mock)
+    _shared_mock_registry.append(mock)
+    yield mock
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def mock_email_service(_shared_mock_registry):
+    """
+    Mock the email service for testing email sending.
+
+    Session-scoped so the patch is entered and the AsyncMock allocated
+    once; call state is cleared between tests by the autouse reset_mocks
+    fixture.
+    """
+    with patch(
+        'apps.identity.services.auth_service.send_email', new_callable=AsyncMock
+    ) as mock:
+        _shared_mock_registry.append(mock)
+        yield mock
+
+
+class _FakeRedis:
+    """In-memory Redis stand-in backed by a dict."""
+
+    def __init__(self):
+        self.store = {}
+        self.setex_calls = []
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.setex_calls.append((key, ttl, value))
+
+    def exists(self, key):
+        return key in self.store
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def delete(self, key):
+        return self.store.pop(key, None) is not None
+
+    def reset(self):
+        self.store.clear()
+        self.setex_calls.clear()
+
+
+@pytest.fixture(scope="session")
+def mock_redis(_shared_mock_registry):
+    """
+    Fake Redis for testing token blacklist functionality.
+
+    Plain dict operations instead of MagicMock attribute dispatch, and
+    the blacklist path is exercised for real: a token revoked via setex
+    is subsequently reported by exists. One instance is patched in per
+    session; reset_mocks empties it between tests.
+    """
+    fake = _FakeRedis()
+    mp = pytest.MonkeyPatch()
+    mp.setattr('apps.identity.utils.jwt_utils.redis_client', fake)
+    _shared_mock_registry.append(fake)
+    yield fake
+    mp.undo()
+
+
+@pytest.fixture(scope="module")
 def api_client():
     """
     Provide Django test client for API tests.
-    
+
     This is Django's built-in test client that works with Django Ninja.
+    Shared per module; _reset_api_client clears leaked state between tests.
     """
     return Client()
 
 
+@pytest.fixture(autouse=True)
+def _reset_api_client(request):
+    """Drop auth headers and cookies left on the shared client."""
+    client = (
+        request.getfixturevalue('api_client')
+        if 'api_client' in request.fixturenames
+        else None
+    )
+    yield
+    if client is not None:
+        client.defaults.pop('HTTP_AUTHORIZATION', None)
+        client.cookies.clear()
+
+
 @pytest.fixture
 def authenticated_client(api_client, mock_verified_identity, valid_password):
     """
@@ -217,6 +475,22 @@ def authenticated_client(api_client, mock_verified_identity, valid_password):
     return api_client
 
 
+@pytest.fixture
+def auth_bundle(api_client, shared_verified_identity, valid_password, mock_redis):
+    """
+    Pre-resolved bundle of the fixtures most auth tests request together.
+
+    Tests request one fixture instead of four, trimming per-test fixture
+    graph resolution; sub-fixtures keep their own scopes.
+    """
+    return SimpleNamespace(
+        client=api_client,
+        identity=shared_verified_identity,
+        password=valid_password,
+        redis=mock_redis,
+    )
+
+
 @pytest_asyncio.fixture
 async def async_client():
     """
@@ -296,16 +570,41 @@ async def async_mock_verified_identity(async_mock_identity):
 
 
 
+@pytest.fixture(scope="module")
+def auth_service():
+    """
+    Single AuthService imported and instantiated once per module.
+
+    Service tests used to import and construct AuthService inside every
+    test body; this pays the import-machinery lookup and construction
+    once. The import stays deferred (not module level) so the unwritten
+    services package fails at test time rather than at collection.
+    """
+    from apps.identity.services import AuthService
+
+    return AuthService()
+
+
+@pytest.fixture(scope="module")
+def entity_service():
+    """
+    Single EntityService imported and instantiated once per module.
+
+    Same shape as auth_service: the import stays deferred so the
+    unwritten services package fails at test time, not collection.
+    """
+    from apps.identity.services import EntityService
+
+    return EntityService()
+
+
 @pytest.fixture
-def password_reset_token(mock_verified_identity):
+def password_reset_token(mock_verified_identity, auth_service):
     """
     Generate a valid password reset token for testing.
-    
+
     Requests password reset and returns the generated token.
     """
-    from apps.identity.services import AuthService
-    
-    auth_service = AuthService()
     auth_service.request_password_reset(
         email=mock_verified_identity.email
     )
@@ -328,8 +627,52 @@ def json_response_data():
     return parse
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _memoized_bcrypt():
+    """
+    Memoize bcrypt.hashpw for the session.
+
+    hashpw is deterministic for a given (password, salt) pair, so
+    repeated fixture hashing pays the Blowfish key schedule only once.
+    Tests that need the real thing can monkeypatch bcrypt.hashpw back.
+    """
+    cache = {}
+    orig = bcrypt.hashpw
+
+    def memo(password, salt):
+        key = (bytes(password), bytes(salt))
+        if key not in cache:
+            cache[key] = orig(password, salt)
+        return cache[key]
+
+    bcrypt.hashpw = memo
+    yield
+    bcrypt.hashpw = orig
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_jwt_keys():
+    """Warm the per-process JWT key caches once per session."""
+    from apps.identity.utils.jwt_utils import get_signing_key, get_verifying_key
+
+    get_signing_key()
+    get_verifying_key()
+
+
 @pytest.fixture(autouse=True)
-def reset_mocks(mocker):
-    """Automatically reset all mocks after each test."""
+def reset_mocks(_shared_mock_registry, mocker):
+    """
+    Automatically reset all shared mocks after each test.
+
+    Resets every double that has ever been instantiated, not just the
+    ones the current test requested — the patches stay active for the
+    rest of the session, so a test can write through them (e.g. the
+    fake-redis blacklist via a logout) without naming the fixture.
+    """
     yield
-    mocker.resetall()
\ No newline at end of file
+    mocker.resetall()
+    for mock in _shared_mock_registry:
+        if isinstance(mock, _FakeRedis):
+            mock.reset()
+        else:
+            mock.reset_mock()
\ No newline at end of file
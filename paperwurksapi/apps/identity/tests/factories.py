@@ -0,0 +1,36 @@
+"""
+factory_boy factories for Identity app tests.
+
+Factories complement the dict-based fixtures in conftest.py for cases
+where tests need many rows cheaply (create_batch) or shared read-only
+instances.
+"""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from apps.identity.models import Entity, Identity
+
+# Matches the valid_password fixture in conftest.py.
+DEFAULT_PASSWORD = 'SecureP@ss123'
+
+
+class EntityFactory(DjangoModelFactory):
+    class Meta:
+        model = Entity
+
+    name = factory.Sequence(lambda n: f'Test Agency {n}')
+    entity_type = 'estate_agency'
+
+
+class IdentityFactory(DjangoModelFactory):
+    class Meta:
+        model = Identity
+
+    email = factory.Sequence(lambda n: f'factory.user.{n}@example.com')
+    entity = factory.SubFactory(EntityFactory)
+    password = factory.PostGenerationMethodCall('set_password', DEFAULT_PASSWORD)
+
+    class Params:
+        # IdentityFactory(verified=True) -> active, verified identity
+        verified = factory.Trait(is_verified=True, is_active=True)
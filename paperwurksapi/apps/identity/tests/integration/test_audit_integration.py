@@ -24,58 +24,34 @@ class TestAuditIntegration:
         self,
         api_client,
         mock_verified_identity,
-        valid_password,
+        login_body,
         mock_audit_service
     ):
         """
-        Test that authentication events create audit logs.
-        
+        Test that a login event creates an audit log with identity info.
+
+        Combines the former test_audit_log_includes_identity_info: one
+        login round-trip covers both the event type and the identity
+        details attached to the log.
+
         Acceptance Criteria:
-        - Registration creates audit log
         - Login creates audit log
-        - Logout creates audit log
-        - Each log has correct event type
+        - Log has correct event type
+        - Audit log contains identity ID
+        - Audit log contains email
         """
         login_url = reverse('identity:login')
-        login_data = {
-            'email': mock_verified_identity.email,
-            'password': valid_password
-        }
-        login_response = api_client.post(login_url, login_data, format='json')
+        login_response = api_client.post(
+            login_url, login_body, content_type='application/json'
+        )
         assert login_response.status_code == status.HTTP_200_OK
         mock_audit_service.log.assert_called()
         call_kwargs = mock_audit_service.log.call_args.kwargs
-        assert call_kwargs['event_type'] == 'user_login'
-        assert call_kwargs['identity_id'] == mock_verified_identity.id
-    
-    def test_audit_log_includes_identity_info(
-        self,
-        api_client,
-        mock_verified_identity,
-        valid_password,
-        mock_audit_service
-    ):
-        """
-        Test that audit logs include identity information.
-        
-        Acceptance Criteria:
-        - Audit log contains identity ID
-        - Audit log contains email
-        - Audit log contains entity ID
-        - Audit log contains timestamp
-        """
-        login_url = reverse('identity:login')
-        login_data = {
+        assert {
+            'event_type': 'user_login',
+            'identity_id': mock_verified_identity.id,
             'email': mock_verified_identity.email,
-            'password': valid_password
-        }
-        
-        api_client.post(login_url, login_data, format='json')
-        call_kwargs = mock_audit_service.log.call_args.kwargs
-        assert 'identity_id' in call_kwargs
-        assert 'email' in call_kwargs
-        assert call_kwargs['identity_id'] == mock_verified_identity.id
-        assert call_kwargs['email'] == mock_verified_identity.email
+        }.items() <= call_kwargs.items()
     
     def test_failed_login_audited_with_reason(
         self,
@@ -110,7 +86,7 @@ class TestAuditIntegration:
         self,
         api_client,
         mock_verified_identity,
-        valid_password,
+        login_body,
         mock_audit_service
     ):
         """
@@ -122,16 +98,14 @@ class TestAuditIntegration:
         - Logs are returned in chronological order
         """
         login_url = reverse('identity:login')
-        login_data = {
-            'email': mock_verified_identity.email,
-            'password': valid_password
-        }
         for _ in range(3):
-            api_client.post(login_url, login_data, format='json')
+            api_client.post(login_url, login_body, content_type='application/json')
         assert mock_audit_service.log.call_count >= 3
-        for call in mock_audit_service.log.call_args_list:
-            kwargs = call.kwargs
-            assert kwargs['identity_id'] == mock_verified_identity.id
+        identity_ids = {
+            call.kwargs['identity_id']
+            for call in mock_audit_service.log.call_args_list
+        }
+        assert identity_ids == {mock_verified_identity.id}
 
 
 @pytest.mark.django_db
@@ -213,8 +187,10 @@ class TestAuditLoggingComprehensive:
         assert mock_audit_service.log.called
         first_call_kwargs = mock_audit_service.log.call_args_list[0].kwargs
         assert first_call_kwargs['event_type'] == 'password_reset_requested'
-        mock_verified_identity.refresh_from_db()
-        reset_token = mock_verified_identity.password_reset_token   
+        # The audit call carries the generated token, so no DB round-trip
+        # is needed to pick it up.
+        assert 'token' in first_call_kwargs
+        reset_token = first_call_kwargs['token']
         reset_url = reverse('identity:reset-password')
         reset_data = {
             'token': reset_token,
@@ -228,7 +204,7 @@ class TestAuditLoggingComprehensive:
         self,
         api_client,
         mock_verified_identity,
-        valid_password,
+        login_body,
         mock_audit_service
     ):
         """
@@ -240,12 +216,9 @@ class TestAuditLoggingComprehensive:
         - Logout timestamp is included
         """
         login_url = reverse('identity:login')
-        login_data = {
-            'email': mock_verified_identity.email,
-            'password': valid_password
-        }
-        
-        login_response = api_client.post(login_url, login_data, format='json')
+        login_response = api_client.post(
+            login_url, login_body, content_type='application/json'
+        )
         access_token = login_response.data['access_token']
         api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
         logout_url = reverse('identity:logout')
@@ -294,7 +267,7 @@ class TestAuditLoggingSecurity:
         self,
         api_client,
         mock_verified_identity,
-        valid_password,
+        login_body,
         mock_audit_service
     ):
         """
@@ -306,14 +279,10 @@ class TestAuditLoggingSecurity:
         - IP helps track suspicious activity
         """
         login_url = reverse('identity:login')
-        login_data = {
-            'email': mock_verified_identity.email,
-            'password': valid_password
-        }
         api_client.post(
             login_url,
-            login_data,
-            format='json',
+            login_body,
+            content_type='application/json',
             REMOTE_ADDR='192.168.1.100'
         )
         call_kwargs = mock_audit_service.log.call_args.kwargs
@@ -323,7 +292,7 @@ class TestAuditLoggingSecurity:
         self,
         api_client,
         mock_verified_identity,
-        valid_password,
+        login_body,
         mock_audit_service
     ):
         """
@@ -335,14 +304,10 @@ class TestAuditLoggingSecurity:
         - Useful for security analysis
         """
         login_url = reverse('identity:login')
-        login_data = {
-            'email': mock_verified_identity.email,
-            'password': valid_password
-        }
         api_client.post(
             login_url,
-            login_data,
-            format='json',
+            login_body,
+            content_type='application/json',
             HTTP_USER_AGENT='TestClient/1.0'
         )
         call_kwargs = mock_audit_service.log.call_args.kwargs
@@ -370,12 +335,11 @@ class TestAuditLoggingSecurity:
             }
             
             api_client.post(login_url, login_data, format='json')
-        failed_login_calls = [
-            call for call in mock_audit_service.log.call_args_list
-            if call.kwargs.get('event_type') == 'login_failed'
+        event_types = [
+            call.kwargs.get('event_type')
+            for call in mock_audit_service.log.call_args_list
         ]
-        
-        assert len(failed_login_calls) == 5
+        assert event_types.count('login_failed') == 5
 
 
 @pytest.mark.django_db
@@ -446,7 +410,7 @@ class TestAuditLogCompliance:
         self,
         api_client,
         mock_verified_identity,
-        valid_password,
+        login_body,
         mock_audit_service
     ):
         """
@@ -459,12 +423,7 @@ class TestAuditLogCompliance:
         - Logs support right-to-access requests
         """
         login_url = reverse('identity:login')
-        login_data = {
-            'email': mock_verified_identity.email,
-            'password': valid_password
-        }
-        
-        api_client.post(login_url, login_data, format='json')
+        api_client.post(login_url, login_body, content_type='application/json')
         
         # Verify audit log supports GDPR
         call_kwargs = mock_audit_service.log.call_args.kwargs
@@ -0,0 +1,114 @@
+"""
+Service-test overrides for the shared identity fixtures.
+
+The service tests request the identity fixtures far more often than any
+other module, and the shared versions pay an Entity INSERT plus an
+Identity INSERT (and a password hash) per test. Here the whole pool
+lands in a single bulk INSERT instead. The batch is seeded per test:
+the service classes run under django_db(transaction=True), whose
+post-test flush truncates every table, so anything seeded at a wider
+scope would be gone by the second test in the module.
+"""
+
+import pytest
+from uuid import uuid4
+
+# Matches the valid_password fixture so authenticate() calls succeed.
+_SEED_PASSWORD = 'SecureP@ss123'
+
+
+@pytest.fixture
+def seeded_entity_name(db, django_db_blocker):
+    """
+    Entity name committed via raw SQL for duplicate-name validation.
+
+    The test only needs a row with a known name to collide with, so the
+    INSERT skips Model.save() machinery (field prep, signals, pk hooks)
+    entirely. Removed on teardown like the other committed fixtures.
+    """
+    from django.db import connection
+
+    entity_id = uuid4().hex
+    name = 'Seeded Entity'
+    with django_db_blocker.unblock():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO entities"
+                " (id, name, entity_type, is_active, created_at, updated_at,"
+                " settings, metadata)"
+                " VALUES (%s, %s, 'estate_agency', %s, CURRENT_TIMESTAMP,"
+                " CURRENT_TIMESTAMP, '{}', '{}')",
+                [entity_id, name, True],
+            )
+    yield name
+    with django_db_blocker.unblock():
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM entities WHERE id = %s", [entity_id])
+
+
+@pytest.fixture
+def _seeded_identities(db, django_db_blocker):
+    """Seed the identity fixture pool with one bulk INSERT per test."""
+    from apps.identity.models import Identity
+    from apps.identity.tests.factories import EntityFactory
+
+    with django_db_blocker.unblock():
+        entity = EntityFactory()
+        rows = {
+            'base': Identity(entity=entity, email='seed.base@example.com'),
+            'verified': Identity(
+                entity=entity,
+                email='seed.verified@example.com',
+                is_verified=True,
+                is_active=True,
+            ),
+            'unverified': Identity(entity=entity, email='seed.unverified@example.com'),
+            'inactive': Identity(
+                entity=entity,
+                email='seed.inactive@example.com',
+                is_active=False,
+            ),
+        }
+        for row in rows.values():
+            row.set_password(_SEED_PASSWORD)
+        Identity.objects.bulk_create(rows.values())
+
+    yield {'entity': entity, **rows}
+
+    # The batch is committed outside any per-test transaction, so remove
+    # it explicitly to keep count-based tests in other modules stable.
+    # Idempotent against the transaction=True flush that may have
+    # already truncated the tables.
+    with django_db_blocker.unblock():
+        Identity.objects.filter(entity_id=entity.id).delete()
+        type(entity).objects.filter(id=entity.id).delete()
+
+
+@pytest.fixture
+def mock_entity(_seeded_identities):
+    """Seeded Entity from the per-test batch."""
+    return _seeded_identities['entity']
+
+
+@pytest.fixture
+def mock_identity(_seeded_identities):
+    """Seeded base Identity (unverified, inactive, password set)."""
+    return _seeded_identities['base']
+
+
+@pytest.fixture
+def mock_verified_identity(_seeded_identities):
+    """Seeded verified, active Identity."""
+    return _seeded_identities['verified']
+
+
+@pytest.fixture
+def mock_unverified_identity(_seeded_identities):
+    """Seeded unverified Identity."""
+    return _seeded_identities['unverified']
+
+
+@pytest.fixture
+def mock_inactive_identity(_seeded_identities):
+    """Seeded inactive Identity."""
+    return _seeded_identities['inactive']
@@ -10,39 +10,64 @@ Covers:
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock, call, AsyncMock
 import bcrypt
-from freezegun import freeze_time
+
+from apps.identity.models import Identity
 
 pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
 
 
+@pytest_asyncio.fixture
+async def authenticated_tokens(auth_service, mock_verified_identity, valid_password):
+    """
+    Token pair from a single authenticate() call.
+
+    The token-management tests all ran their own login as setup; sharing
+    this fixture drops the redundant password-check + JWT-sign cycles.
+    Function-scoped rather than class-scoped because the identity row it
+    authenticates against lives inside the per-test transaction.
+    """
+    return await auth_service.authenticate(
+        email=mock_verified_identity.email,
+        password=valid_password,
+    )
+
+
 @pytest.mark.django_db(transaction=True)
+@pytest.mark.xdist_group(name="auth_registration")
 class TestRegistrationService:
     """Test user registration service methods (US-006)."""
     
-    async def test_register_user_creates_identity(
-        self, 
-        identity_data, 
+    async def test_register_full_side_effects(
+        self,
+        identity_data,
         mock_entity,
+        mock_email_service,
+        mock_audit_service,
+        auth_service,
     ):
         """
-        Test that registration creates a new Identity.
-        
+        Test the full register() workflow in one traversal.
+
+        Folds the former creates-identity / sends-verification-email /
+        creates-audit-log tests into a single register() call: the same
+        union of assertions against one bcrypt hash and one INSERT
+        instead of three.
+
         Acceptance Criteria:
-        - Identity is created in database
-        - All required fields are populated
-        - Identity is returned
+        - Identity is created with all required fields populated
+        - Verification email is sent with the verification token
+        - Audit log records the 'user_registered' event
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         identity = await auth_service.register(
             entity=mock_entity,
             **identity_data
         )
-        
+
+        # Identity is created in database with required fields
         assert identity is not None
         assert identity.email == identity_data['email']
         assert identity.first_name == identity_data['first_name']
@@ -50,145 +75,128 @@ class TestRegistrationService:
         assert identity.entity == mock_entity
         assert identity.is_active is False
         assert identity.is_verified is False
-    
-    async def test_register_user_sends_verification_email(
-        self,
-        identity_data,
-        mock_entity,
-        mock_email_service
-    ):
-        """
-        Test that registration sends verification email.
-        
-        Acceptance Criteria:
-        - Email service is called with correct parameters
-        - Verification token is included in email
-        """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        identity = await auth_service.register(
-            entity=mock_entity,
-            **identity_data
-        )
-        
+
+        # Email service is called with the verification token; kwargs
+        # are checked directly instead of substring-matching the repr
+        # of the whole call object.
         mock_email_service.assert_awaited_once()
-        call_args = mock_email_service.call_args
-        
-        assert identity.email in str(call_args)
-        assert identity.verification_token in str(call_args)
-    
-    async def test_register_user_creates_audit_log(
-        self,
-        identity_data,
-        mock_entity,
-        mock_audit_service
-    ):
-        """
-        Test that registration creates audit log entry.
-        
-        Acceptance Criteria:
-        - AuditService is called
-        - Event type is 'user_registered'
-        - Identity ID is logged
-        """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        identity = await auth_service.register(
-            entity=mock_entity,
-            **identity_data
-        )
-        
+        call_kwargs = mock_email_service.call_args.kwargs
+
+        assert call_kwargs.get('to') == identity.email
+        assert 'token' in call_kwargs
+        assert call_kwargs['token'] == identity.verification_token
+
+        # AuditService logs the registration
         mock_audit_service.log.assert_awaited_once()
         call_kwargs = mock_audit_service.log.call_args.kwargs
-        
+
         assert call_kwargs['event_type'] == 'user_registered'
         assert call_kwargs['identity_id'] == identity.id
         assert call_kwargs['email'] == identity.email
-    
+
     async def test_register_user_fails_with_duplicate_email(
         self,
-        identity_data,
+        identity_kwargs,
         mock_entity,
-        mock_identity
+        mock_identity,
+        auth_service,
     ):
         """
         Test that registration fails with duplicate email.
-        
+
         Acceptance Criteria:
         - ValueError is raised
         - Error message mentions duplicate email
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        
-        # Use existing identity's email
-        identity_data['email'] = mock_identity.email
-        
-        async with pytest.raises(ValueError, match="Email already exists"):
+
+        with pytest.raises(ValueError, match="Email already exists"):
             await auth_service.register(
                 entity=mock_entity,
-                **identity_data
+                # Use existing identity's email
+                **identity_kwargs(email=mock_identity.email)
             )
     
-    async def test_register_user_fails_with_weak_password(
+    @pytest.mark.parametrize('entry_point', ['register', 'reset'])
+    async def test_weak_password_rejected(
         self,
+        entry_point,
         identity_data,
         mock_entity,
-        weak_password
+        mock_verified_identity,
+        weak_password,
+        auth_service,
     ):
         """
-        Test that registration fails with weak password.
-        
+        Test that both password entry points reject weak passwords.
+
+        One parametrized test exercises the shared validator through
+        register() and reset_password() instead of two tests paying
+        full fixture setup each.
+
         Acceptance Criteria:
         - ValueError is raised
         - Error message mentions password requirements
-        """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        identity_data['password'] = weak_password
-        
-        async with pytest.raises(ValueError, match="Password does not meet requirements"):
-            await auth_service.register(
-                entity=mock_entity,
-                **identity_data
+        - For reset: the stored password is not changed
+        """
+        if entry_point == 'register':
+            with pytest.raises(
+                ValueError, match="Password does not meet requirements"
+            ):
+                await auth_service.register(
+                    entity=mock_entity,
+                    **{**identity_data, 'password': weak_password}
+                )
+        else:
+            await auth_service.request_password_reset(
+                email=mock_verified_identity.email
             )
+
+            await mock_verified_identity.arefresh_from_db()
+            reset_token = mock_verified_identity.password_reset_token
+            original_password_hash = mock_verified_identity.password
+
+            with pytest.raises(
+                ValueError, match="Password does not meet requirements"
+            ):
+                await auth_service.reset_password(
+                    token=reset_token,
+                    new_password=weak_password
+                )
+
+            await mock_verified_identity.arefresh_from_db()
+            assert mock_verified_identity.password == original_password_hash
     
     async def test_register_user_validates_email_format(
         self,
-        identity_data,
-        mock_entity
+        identity_kwargs,
+        mock_entity,
+        auth_service,
     ):
         """
         Test that registration validates email format.
-        
+
         Acceptance Criteria:
         - ValueError is raised for invalid email
         - Error message mentions invalid email format
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        identity_data['email'] = 'invalid-email'
-        
-        async with pytest.raises(ValueError, match="Invalid email format"):
+
+        with pytest.raises(ValueError, match="Invalid email format"):
             await auth_service.register(
                 entity=mock_entity,
-                **identity_data
+                **identity_kwargs(email='invalid-email')
             )
 
 
 @pytest.mark.django_db(transaction=True)
+@pytest.mark.xdist_group(name="auth_login")
 class TestLoginService:
     """Test user login/authentication service methods (US-007)."""
     
     async def test_authenticate_with_valid_credentials(
         self,
         mock_verified_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test successful authentication with valid credentials.
@@ -198,9 +206,6 @@ class TestLoginService:
         - Identity object is returned
         - JWT tokens are generated
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         result = await auth_service.authenticate(
             email=mock_verified_identity.email,
             password=valid_password
@@ -213,7 +218,8 @@ class TestLoginService:
     
     async def test_authenticate_fails_with_invalid_password(
         self,
-        mock_verified_identity
+        mock_verified_identity,
+        auth_service,
     ):
         """
         Test authentication fails with incorrect password.
@@ -222,11 +228,8 @@ class TestLoginService:
         - ValueError is raised
         - Error message indicates invalid credentials
         """
-        from apps.identity.services import AuthService
         
-        auth_service = AuthService()
-        
-        async with pytest.raises(ValueError, match="Invalid credentials"):
+        with pytest.raises(ValueError, match="Invalid credentials"):
             await auth_service.authenticate(
                 email=mock_verified_identity.email,
                 password='WrongPassword123!'
@@ -235,7 +238,8 @@ class TestLoginService:
     async def test_authenticate_fails_for_unverified_user(
         self,
         mock_unverified_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test authentication fails for unverified users.
@@ -244,11 +248,8 @@ class TestLoginService:
         - PermissionError is raised
         - Error message mentions email verification
         """
-        from apps.identity.services import AuthService
         
-        auth_service = AuthService()
-        
-        async with pytest.raises(PermissionError, match="Email not verified"):
+        with pytest.raises(PermissionError, match="Email not verified"):
             await auth_service.authenticate(
                 email=mock_unverified_identity.email,
                 password=valid_password
@@ -257,7 +258,8 @@ class TestLoginService:
     async def test_authenticate_fails_for_inactive_user(
         self,
         mock_inactive_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test authentication fails for inactive accounts.
@@ -266,48 +268,53 @@ class TestLoginService:
         - PermissionError is raised
         - Error message mentions inactive account
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         
-        async with pytest.raises(PermissionError, match="Account is inactive"):
+        with pytest.raises(PermissionError, match="Account is inactive"):
             await auth_service.authenticate(
                 email=mock_inactive_identity.email,
                 password=valid_password
             )
     
-    @freeze_time("2025-10-16 12:00:00")
     async def test_authenticate_updates_last_login(
         self,
         mock_verified_identity,
-        valid_password
+        valid_password,
+        auth_service,
+        monkeypatch,
     ):
         """
         Test that successful login updates last_login timestamp.
-        
+
         Acceptance Criteria:
         - last_login is updated to current time
         - Timestamp is persisted to database
+
+        Pins timezone.now with a targeted monkeypatch instead of
+        freeze_time, whose module-walk patches every datetime call site
+        in sys.modules for a single assertion.
         """
-        from apps.identity.services import AuthService
-        
+        from datetime import timezone as dt_timezone
+
+        frozen_now = datetime(2025, 10, 16, 12, 0, 0, tzinfo=dt_timezone.utc)
+        monkeypatch.setattr('django.utils.timezone.now', lambda: frozen_now)
+
         assert mock_verified_identity.last_login is None
-        
-        auth_service = AuthService()
+
         await auth_service.authenticate(
             email=mock_verified_identity.email,
             password=valid_password
         )
-        
+
         await mock_verified_identity.arefresh_from_db()
         assert mock_verified_identity.last_login is not None
-        assert mock_verified_identity.last_login == datetime(2025, 10, 16, 12, 0, 0)
+        assert mock_verified_identity.last_login == frozen_now
     
     async def test_authenticate_creates_audit_log(
         self,
         mock_verified_identity,
         valid_password,
-        mock_audit_service
+        mock_audit_service,
+        auth_service,
     ):
         """
         Test that login creates audit log entry.
@@ -317,9 +324,6 @@ class TestLoginService:
         - Event type is 'user_login'
         - Identity ID and email are logged
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         await auth_service.authenticate(
             email=mock_verified_identity.email,
             password=valid_password
@@ -335,7 +339,8 @@ class TestLoginService:
     async def test_generate_jwt_tokens(
         self,
         mock_verified_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test that JWT tokens are generated on login.
@@ -345,9 +350,6 @@ class TestLoginService:
         - Refresh token is generated
         - Tokens are different from each other
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         result = await auth_service.authenticate(
             email=mock_verified_identity.email,
             password=valid_password
@@ -360,7 +362,8 @@ class TestLoginService:
     async def test_jwt_token_contains_correct_claims(
         self,
         mock_verified_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test that JWT tokens contain required claims.
@@ -372,10 +375,8 @@ class TestLoginService:
         - Token includes expiration (exp)
         - Token includes issued at (iat)
         """
-        from apps.identity.services import AuthService
         from apps.identity.utils.jwt_utils import decode_token
         
-        auth_service = AuthService()
         result = await auth_service.authenticate(
             email=mock_verified_identity.email,
             password=valid_password
@@ -391,39 +392,43 @@ class TestLoginService:
 
 
 @pytest.mark.django_db(transaction=True)
+@pytest.mark.xdist_group(name="auth_tokens")
 class TestTokenManagementService:
     """Test JWT token management service methods (US-008)."""
     
-    async def test_validate_token_success(self, jwt_payload):
+    async def test_validate_token_success(self, signed_jwt, jwt_payload):
         """
         Test that valid tokens are successfully validated.
-        
+
         Acceptance Criteria:
         - Token validation returns True
         - Payload is correctly decoded
+
+        Uses the module-scoped signed_jwt so the signing cost is paid
+        once rather than per test.
         """
-        from apps.identity.utils.jwt_utils import generate_token, validate_token
-        
-        token = generate_token(jwt_payload)
-        is_valid, payload = await validate_token(token)
-        
+        from apps.identity.utils.jwt_utils import validate_token
+
+        is_valid, payload = await validate_token(signed_jwt)
+
         assert is_valid is True
         assert payload['sub'] == jwt_payload['sub']
         assert payload['email'] == jwt_payload['email']
-    
+
     async def test_validate_token_fails_for_expired(self, jwt_payload):
         """
         Test that expired tokens fail validation.
-        
+
         Acceptance Criteria:
         - Token validation returns False
         - Error indicates token expired
         """
         from apps.identity.utils.jwt_utils import generate_token, validate_token
-        
-        # Create expired token
-        jwt_payload['exp'] = datetime.utcnow() - timedelta(hours=1)
-        token = generate_token(jwt_payload)
+
+        # Clone the shared payload rather than mutating it; only the
+        # exp claim differs, so only this token pays a fresh signature.
+        expired_payload = {**jwt_payload, 'exp': datetime.utcnow() - timedelta(hours=1)}
+        token = generate_token(expired_payload)
         
         is_valid, error = await validate_token(token)
         
@@ -450,29 +455,20 @@ class TestTokenManagementService:
     
     async def test_refresh_token_generates_new_access_token(
         self,
-        mock_verified_identity,
-        valid_password
+        authenticated_tokens,
+        auth_service,
     ):
         """
         Test that refresh token generates new access token.
-        
+
         Acceptance Criteria:
         - New access token is generated
         - New token is different from original
         - New token has updated expiration
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        
-        # Initial login
-        result = await auth_service.authenticate(
-            email=mock_verified_identity.email,
-            password=valid_password
-        )
-        original_access_token = result['access_token']
-        refresh_token = result['refresh_token']
-        
+        original_access_token = authenticated_tokens['access_token']
+        refresh_token = authenticated_tokens['refresh_token']
+
         # Refresh token
         new_result = await auth_service.refresh_access_token(refresh_token)
         new_access_token = new_result['access_token']
@@ -482,176 +478,127 @@ class TestTokenManagementService:
     
     async def test_refresh_token_fails_with_access_token(
         self,
-        mock_verified_identity,
-        valid_password
+        authenticated_tokens,
+        auth_service,
     ):
         """
         Test that using access token for refresh fails.
-        
+
         Acceptance Criteria:
         - ValueError is raised
         - Error message indicates wrong token type
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        
-        result = await auth_service.authenticate(
-            email=mock_verified_identity.email,
-            password=valid_password
-        )
-        access_token = result['access_token']
-        
-        async with pytest.raises(ValueError, match="Invalid token type"):
+        access_token = authenticated_tokens['access_token']
+
+        with pytest.raises(ValueError, match="Invalid token type"):
             await auth_service.refresh_access_token(access_token)
     
     async def test_revoke_token_adds_to_blacklist(
         self,
-        mock_verified_identity,
-        valid_password,
-        mock_redis
+        authenticated_tokens,
+        mock_redis,
+        auth_service,
     ):
         """
         Test that token revocation adds token to blacklist.
-        
+
         Acceptance Criteria:
         - Token is added to Redis blacklist
         - TTL is set to token expiration time
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        
-        result = await auth_service.authenticate(
-            email=mock_verified_identity.email,
-            password=valid_password
-        )
-        access_token = result['access_token']
-        
+        access_token = authenticated_tokens['access_token']
+
         await auth_service.revoke_token(access_token)
-        
-        mock_redis.setex.assert_called_once()
-        call_args = mock_redis.setex.call_args
-        assert access_token in str(call_args)
+
+        # The fake records plain tuples, so the assertions are dict and
+        # tuple lookups instead of MagicMock call bookkeeping.
+        assert len(mock_redis.setex_calls) == 1
+        key, ttl, _value = mock_redis.setex_calls[0]
+        assert access_token in key
+        assert ttl > 0
     
     async def test_blacklisted_token_is_rejected(
         self,
-        mock_verified_identity,
-        valid_password,
-        mock_redis
+        authenticated_tokens,
+        mock_redis,
+        auth_service,
     ):
         """
         Test that blacklisted tokens are rejected.
-        
+
         Acceptance Criteria:
         - Validation fails for blacklisted token
         - Error message indicates token is revoked
         """
-        from apps.identity.services import AuthService
         from apps.identity.utils.jwt_utils import is_token_blacklisted
-        
-        auth_service = AuthService()
-        
-        result = await auth_service.authenticate(
-            email=mock_verified_identity.email,
-            password=valid_password
-        )
-        access_token = result['access_token']
-        
-        # Mock Redis to return token exists in blacklist
-        mock_redis.exists.return_value = True
-        
+
+        access_token = authenticated_tokens['access_token']
+
+        # Revoke through the real path: the dict-backed fake makes the
+        # token visible to exists() without return_value coercion.
+        await auth_service.revoke_token(access_token)
+
         is_blacklisted = await is_token_blacklisted(access_token)
-        
+
         assert is_blacklisted is True
 
 
 @pytest.mark.django_db(transaction=True)
+@pytest.mark.xdist_group(name="auth_password_reset")
 class TestPasswordResetService:
     """Test password reset service methods (US-009)."""
     
-    async def test_request_password_reset_generates_token(
+    async def test_request_password_reset_full_side_effects(
         self,
         mock_verified_identity,
-        mock_email_service
+        mock_email_service,
+        mock_audit_service,
+        auth_service,
     ):
         """
-        Test that password reset request generates reset token.
-        
+        Test the full request_password_reset() workflow in one traversal.
+
+        Folds the former generates-token / sends-email / creates-audit-log
+        tests into a single request: same assertions, one token
+        generation and one email instead of three.
+
         Acceptance Criteria:
-        - Reset token is generated
-        - Token expiration is set (1 hour)
-        - Token is persisted to database
+        - Reset token is generated, persisted and set to expire
+        - Reset email is sent to the right address with the token
+        - Audit log records the 'password_reset_requested' event
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         result = await auth_service.request_password_reset(
             email=mock_verified_identity.email
         )
-        
+
+        # Token is generated and persisted with an expiry
         await mock_verified_identity.arefresh_from_db()
-        
+
         assert mock_verified_identity.password_reset_token is not None
-        assert mock_verified_identity.password_reset_expires_at is not None
+        assert mock_verified_identity.password_reset_token_expires is not None
         assert result['message'] == 'Password reset email sent'
-    
-    async def test_request_password_reset_sends_email(
-        self,
-        mock_verified_identity,
-        mock_email_service
-    ):
-        """
-        Test that password reset request sends email.
-        
-        Acceptance Criteria:
-        - Email service is called
-        - Reset token is included in email
-        - Email is sent to correct address
-        """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        await auth_service.request_password_reset(
-            email=mock_verified_identity.email
-        )
-        
+
+        # Email service is called with the reset token; kwargs are
+        # checked directly instead of substring-matching the call repr.
         mock_email_service.assert_awaited_once()
-        call_args = mock_email_service.call_args
-        
-        assert mock_verified_identity.email in str(call_args)
-        assert 'reset' in str(call_args).lower()
-    
-    async def test_request_password_reset_creates_audit_log(
-        self,
-        mock_verified_identity,
-        mock_audit_service
-    ):
-        """
-        Test that password reset request creates audit log.
-        
-        Acceptance Criteria:
-        - AuditService is called
-        - Event type is 'password_reset_requested'
-        - Identity email is logged
-        """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        await auth_service.request_password_reset(
-            email=mock_verified_identity.email
-        )
-        
+        call_kwargs = mock_email_service.call_args.kwargs
+
+        assert call_kwargs.get('to') == mock_verified_identity.email
+        assert 'token' in call_kwargs
+        assert call_kwargs['token'] == mock_verified_identity.password_reset_token
+
+        # AuditService logs the request
         mock_audit_service.log.assert_awaited_once()
         call_kwargs = mock_audit_service.log.call_args.kwargs
-        
+
         assert call_kwargs['event_type'] == 'password_reset_requested'
         assert call_kwargs['email'] == mock_verified_identity.email
-    
+
     async def test_reset_password_with_valid_token(
         self,
         mock_verified_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test password reset with valid token.
@@ -661,33 +608,36 @@ class TestPasswordResetService:
         - Reset token is cleared
         - Success message is returned
         """
-        from apps.identity.services import AuthService
-        
         # First request password reset
-        auth_service = AuthService()
         await auth_service.request_password_reset(
             email=mock_verified_identity.email
         )
         
-        await mock_verified_identity.arefresh_from_db()
-        reset_token = mock_verified_identity.password_reset_token
-        
+        # Narrow re-read: just the token column instead of the full row
+        reset_token = (
+            await Identity.objects.only('password_reset_token')
+            .aget(pk=mock_verified_identity.pk)
+        ).password_reset_token
+
         # Reset password with token
         new_password = "NewSecureP@ss456"
         result = await auth_service.reset_password(
             token=reset_token,
             new_password=new_password
         )
-        
-        await mock_verified_identity.arefresh_from_db()
-        
+
+        refreshed = await Identity.objects.only(
+            'password_reset_token', 'password_reset_token_expires'
+        ).aget(pk=mock_verified_identity.pk)
+
         assert result['message'] == 'Password reset successfully'
-        assert mock_verified_identity.password_reset_token is None
-        assert mock_verified_identity.password_reset_expires_at is None
+        assert refreshed.password_reset_token is None
+        assert refreshed.password_reset_token_expires is None
     
     async def test_reset_password_with_expired_token(
         self,
-        mock_verified_identity
+        mock_verified_identity,
+        auth_service,
     ):
         """
         Test password reset with expired token fails.
@@ -697,30 +647,33 @@ class TestPasswordResetService:
         - Error message indicates token expired
         - Password is not changed
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         
-        # Set expired token
+        # Set expired token: update only the two token columns, then
+        # mirror the state on the local instance.
+        expired_at = datetime.utcnow() - timedelta(hours=2)
+        await Identity.objects.filter(id=mock_verified_identity.id).aupdate(
+            password_reset_token='expired-token',
+            password_reset_token_expires=expired_at,
+        )
         mock_verified_identity.password_reset_token = 'expired-token'
-        mock_verified_identity.password_reset_expires_at = datetime.utcnow() - timedelta(hours=2)
-        await mock_verified_identity.asave()
+        mock_verified_identity.password_reset_token_expires = expired_at
         
-        original_password_hash = mock_verified_identity.password_hash
+        original_password_hash = mock_verified_identity.password
         
-        async with pytest.raises(ValueError, match="Reset token expired"):
+        with pytest.raises(ValueError, match="Reset token expired"):
             await auth_service.reset_password(
                 token='expired-token',
                 new_password='NewPassword123!'
             )
         
         await mock_verified_identity.arefresh_from_db()
-        assert mock_verified_identity.password_hash == original_password_hash
+        assert mock_verified_identity.password == original_password_hash
     
     async def test_reset_password_updates_password_hash(
         self,
         mock_verified_identity,
-        valid_password
+        valid_password,
+        auth_service,
     ):
         """
         Test that password reset updates password hash using bcrypt.
@@ -730,89 +683,58 @@ class TestPasswordResetService:
         - New password can be verified
         - Old password no longer works
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         
         # Request reset
         await auth_service.request_password_reset(
             email=mock_verified_identity.email
         )
         
-        await mock_verified_identity.arefresh_from_db()
-        reset_token = mock_verified_identity.password_reset_token
-        original_password_hash = mock_verified_identity.password_hash
-        
+        # One narrow SELECT for both fields instead of a full-row refresh
+        before = await Identity.objects.only(
+            'password_reset_token', 'password'
+        ).aget(pk=mock_verified_identity.pk)
+        reset_token = before.password_reset_token
+        original_password_hash = before.password
+
         # Reset with new password
         new_password = "NewSecureP@ss456"
         await auth_service.reset_password(
             token=reset_token,
             new_password=new_password
         )
-        
-        await mock_verified_identity.arefresh_from_db()
-        
+
+        after = await Identity.objects.only(
+            'password'
+        ).aget(pk=mock_verified_identity.pk)
+
         # Verify password hash changed
-        assert mock_verified_identity.password_hash != original_password_hash
-        
+        assert after.password != original_password_hash
+
         # Verify new password works
         is_valid = bcrypt.checkpw(
             new_password.encode('utf-8'),
-            mock_verified_identity.password_hash.encode('utf-8')
+            after.password.encode('utf-8')
         )
         assert is_valid is True
         
         # Verify old password doesn't work
         is_old_valid = bcrypt.checkpw(
             valid_password.encode('utf-8'),
-            mock_verified_identity.password_hash.encode('utf-8')
+            after.password.encode('utf-8')
         )
         assert is_old_valid is False
     
-    async def test_reset_password_with_weak_password_fails(
-        self,
-        mock_verified_identity,
-        weak_password
-    ):
-        """
-        Test that password reset with weak password fails.
-        
-        Acceptance Criteria:
-        - ValueError is raised
-        - Error mentions password requirements
-        - Password is not changed
-        """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        
-        # Request reset
-        await auth_service.request_password_reset(
-            email=mock_verified_identity.email
-        )
-        
-        await mock_verified_identity.arefresh_from_db()
-        reset_token = mock_verified_identity.password_reset_token
-        original_password_hash = mock_verified_identity.password_hash
-        
-        async with pytest.raises(ValueError, match="Password does not meet requirements"):
-            await auth_service.reset_password(
-                token=reset_token,
-                new_password=weak_password
-            )
-        
-        await mock_verified_identity.arefresh_from_db()
-        assert mock_verified_identity.password_hash == original_password_hash
-
 
 @pytest.mark.django_db(transaction=True)
+@pytest.mark.xdist_group(name="auth_email_verification")
 class TestEmailVerificationService:
     """Test email verification service methods (US-010A)."""
     
     async def test_send_verification_email(
         self,
         mock_unverified_identity,
-        mock_email_service
+        mock_email_service,
+        auth_service,
     ):
         """
         Test that verification email is sent.
@@ -822,21 +744,21 @@ class TestEmailVerificationService:
         - Verification token is included
         - Email is sent to correct address
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         await auth_service.send_verification_email(mock_unverified_identity)
         
+        # Direct kwargs checks instead of substring-matching the call repr
         mock_email_service.assert_awaited_once()
-        call_args = mock_email_service.call_args
-        
-        assert mock_unverified_identity.email in str(call_args)
-        assert mock_unverified_identity.verification_token in str(call_args)
+        call_kwargs = mock_email_service.call_args.kwargs
+
+        assert call_kwargs.get('to') == mock_unverified_identity.email
+        assert 'token' in call_kwargs
+        assert call_kwargs['token'] == mock_unverified_identity.verification_token
     
     async def test_verify_email_creates_audit_log(
         self,
         mock_unverified_identity,
-        mock_audit_service
+        mock_audit_service,
+        auth_service,
     ):
         """
         Test that email verification creates audit log.
@@ -846,9 +768,6 @@ class TestEmailVerificationService:
         - Event type is 'email_verified'
         - Identity ID is logged
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         token = mock_unverified_identity.verification_token
         
         await auth_service.verify_email(token)
@@ -861,7 +780,8 @@ class TestEmailVerificationService:
     
     async def test_resend_verification_generates_new_token(
         self,
-        mock_unverified_identity
+        mock_unverified_identity,
+        auth_service,
     ):
         """
         Test that resending verification generates new token.
@@ -871,22 +791,23 @@ class TestEmailVerificationService:
         - New token is different from original
         - Expiration is updated
         """
-        from apps.identity.services import AuthService
-        
         original_token = mock_unverified_identity.verification_token
-        original_expiry = mock_unverified_identity.verification_token_expires_at
+        original_expiry = mock_unverified_identity.verification_token_expires
         
-        auth_service = AuthService()
         await auth_service.resend_verification_email(mock_unverified_identity.email)
-        
-        await mock_unverified_identity.arefresh_from_db()
-        
-        assert mock_unverified_identity.verification_token != original_token
-        assert mock_unverified_identity.verification_token_expires_at > original_expiry
+
+        # Narrow re-read of just the rotated columns
+        refreshed = await Identity.objects.only(
+            'verification_token', 'verification_token_expires'
+        ).aget(pk=mock_unverified_identity.pk)
+
+        assert refreshed.verification_token != original_token
+        assert refreshed.verification_token_expires > original_expiry
     
     async def test_resend_verification_invalidates_old_token(
         self,
-        mock_unverified_identity
+        mock_unverified_identity,
+        auth_service,
     ):
         """
         Test that resending verification invalidates old token.
@@ -895,9 +816,6 @@ class TestEmailVerificationService:
         - Old token cannot be used for verification
         - Only new token works
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         
         old_token = mock_unverified_identity.verification_token
         
@@ -908,7 +826,7 @@ class TestEmailVerificationService:
         new_token = mock_unverified_identity.verification_token
         
         # Try to verify with old token - should fail
-        async with pytest.raises(ValueError, match="Invalid or expired verification token"):
+        with pytest.raises(ValueError, match="Invalid or expired verification token"):
             await auth_service.verify_email(old_token)
         
         # Verify with new token - should succeed
@@ -917,7 +835,8 @@ class TestEmailVerificationService:
     
     async def test_already_verified_user_cannot_reverify(
         self,
-        mock_verified_identity
+        mock_verified_identity,
+        auth_service,
     ):
         """
         Test that already verified users cannot verify again.
@@ -926,16 +845,14 @@ class TestEmailVerificationService:
         - ValueError is raised
         - Error message indicates already verified
         """
-        from apps.identity.services import AuthService
         
-        auth_service = AuthService()
-        
-        async with pytest.raises(ValueError, match="Email already verified"):
+        with pytest.raises(ValueError, match="Email already verified"):
             await auth_service.verify_email(mock_verified_identity.verification_token)
     
     async def test_verify_email_with_valid_token(
         self,
-        mock_unverified_identity
+        mock_unverified_identity,
+        auth_service,
     ):
         """
         Test successful email verification with valid token.
@@ -946,9 +863,6 @@ class TestEmailVerificationService:
         - verification_token is cleared
         - Success message is returned
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         token = mock_unverified_identity.verification_token
         
         assert mock_unverified_identity.is_verified is False
@@ -965,34 +879,37 @@ class TestEmailVerificationService:
     
     async def test_verify_email_with_expired_token(
         self,
-        mock_unverified_identity
+        mock_unverified_identity,
+        auth_service,
+        monkeypatch,
     ):
         """
         Test email verification with expired token fails.
-        
+
         Acceptance Criteria:
         - ValueError is raised
         - Error message indicates token expired
         - User remains unverified
+
+        Travels the clock past the 24h expiry rather than writing a
+        backdated (naive-datetime) expiry: no UPDATE round-trip, and
+        the service's expiry check sees the pinned future time.
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
-        
-        # Set expired token
-        mock_unverified_identity.verification_token_expires_at = datetime.utcnow() - timedelta(hours=25)
-        await mock_unverified_identity.asave()
-        
+        from django.utils import timezone as dj_timezone
+
         token = mock_unverified_identity.verification_token
-        
-        async with pytest.raises(ValueError, match="Invalid or expired verification token"):
+
+        future = dj_timezone.now() + timedelta(hours=25)
+        monkeypatch.setattr('django.utils.timezone.now', lambda: future)
+
+        with pytest.raises(ValueError, match="Invalid or expired verification token"):
             await auth_service.verify_email(token)
         
         await mock_unverified_identity.arefresh_from_db()
         assert mock_unverified_identity.is_verified is False
         assert mock_unverified_identity.is_active is False
     
-    async def test_verify_email_with_invalid_token(self):
+    async def test_verify_email_with_invalid_token(self, auth_service):
         """
         Test email verification with invalid token fails.
         
@@ -1000,9 +917,6 @@ class TestEmailVerificationService:
         - ValueError is raised
         - Error message indicates invalid token
         """
-        from apps.identity.services import AuthService
-        
-        auth_service = AuthService()
         
-        async with pytest.raises(ValueError, match="Invalid or expired verification token"):
+        with pytest.raises(ValueError, match="Invalid or expired verification token"):
             await auth_service.verify_email("this-is-not-a-valid-token")
\ No newline at end of file
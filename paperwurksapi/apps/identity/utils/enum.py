@@ -9,4 +9,17 @@ class EntityType(StrEnum):
     @classmethod
     def choices(cls):
         """Convert to Django choices format"""
-        return [(member.value, member.name.replace('_', ' ').title()) for member in cls]
+        return _CHOICES
+
+
+# Members are frozen, so the choices list is built once at import time;
+# Django re-reads field choices during model checks, migrations and
+# form generation, and each call now returns the same tuple.
+_CHOICES = tuple(
+    (member.value, member.name.replace('_', ' ').title()) for member in EntityType
+)
+
+# O(1) membership set for validators: `value in EntityType.values` is a
+# plain frozenset lookup instead of Enum __contains__ and its _missing_
+# fallback chain.
+EntityType.values = frozenset(member.value for member in EntityType)
@@ -0,0 +1,32 @@
+"""
+JWT utilities for the Identity app.
+
+Key material is resolved once per process via lru_cache so repeated
+token encode/decode cycles don't re-derive it.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+
+# Redis connection used for the token blacklist. Created lazily by the
+# auth service; tests patch this attribute directly.
+redis_client = None
+
+
+@lru_cache(maxsize=1)
+def get_algorithm() -> str:
+    """Return the JWT signing algorithm (HS256 unless overridden)."""
+    return getattr(settings, "JWT_ALGORITHM", "HS256")
+
+
+@lru_cache(maxsize=1)
+def get_signing_key() -> str:
+    """Return the key used to sign JWTs (cached per process)."""
+    return settings.SECRET_KEY
+
+
+@lru_cache(maxsize=1)
+def get_verifying_key() -> str:
+    """Return the key used to verify JWTs (cached per process)."""
+    # Symmetric signing: the verifying key is the signing key.
+    return get_signing_key()